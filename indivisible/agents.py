@@ -11,7 +11,7 @@ Since: 2020-04
 from abc import ABC, abstractmethod
 from dicttools import stringify
 
-import math, itertools
+import math, itertools, heapq
 from fractions import Fraction
 
 import fairpy.indivisible.partitions as partitions
@@ -347,7 +347,7 @@ class AdditiveAgent(Agent):
         """
         Calculates the agent's value for the given set of goods.
         """
-        return sum([self.map_good_to_value[g] for g in bundle])
+        return sum(self.map_good_to_value[g] for g in bundle)
 
     def value_except_best_c_goods(self, bundle:Bundle, c:int=1)->int:
         """
@@ -413,12 +413,18 @@ class AdditiveAgent(Agent):
         1
         >>> a.value_of_cth_best_good(4)
         0
+        >>> a.value_of_cth_best_good(0)
+        Traceback (most recent call last):
+        ...
+        ValueError: c must be a positive integer, but got 0
         """
+        if c < 1:
+            raise ValueError(f"c must be a positive integer, but got {c}")
         if c > len(self.desired_items):
             return 0
         else:
-            sorted_values = sorted(self.map_good_to_value.values(), reverse=True)
-            return sorted_values[c-1]
+            # only the c largest values are needed - no need to sort all of them.
+            return heapq.nlargest(c, self.map_good_to_value.values())[-1]
 
     def __repr__(self):
         values_as_string = " ".join(["{}={}".format(k,v) for k,v in sorted(self.map_good_to_value.items())])
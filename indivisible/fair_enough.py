@@ -86,7 +86,7 @@ def divide_c_mms_partition(c: int, items: list, item_value_dict: dict) -> List[B
         min_val = float('inf')
         for bund in tmp_partition:
             # Calculate the value of the bundle
-            p_val = sum([item_value_dict[itm] for itm in bund])
+            p_val = sum(item_value_dict[itm] for itm in bund)
             # Updates min value
             min_val = min(min_val, p_val)
 
@@ -219,9 +219,8 @@ def hand_item_to_non_envy(envy_graph: nx.DiGraph, agents_dict: Dict[str, Additiv
     >>> sorted(list(alloc.get_bundle(1)))
     ['c', 'e']
     """
-    rev_di_graph = envy_graph.reverse()
-    for n in rev_di_graph.nodes():
-        if len(rev_di_graph.edges(n)) == 0:
+    for n in envy_graph.nodes():
+        if envy_graph.in_degree(n) == 0:
             pop_item = items_remaining.pop()
             agnt = agents_dict[n]
             agnt.aq_items.append(pop_item)
@@ -244,7 +243,8 @@ def get_highest_value(agent: AdditiveAgent, items_list: List[str]) -> (float, Se
     >>> v,sorted(bndl)
     (9, ['b', 'c', 'd'])
     """
-    items_sorted_by_agent = sorted([x for x in agent.desired_items if x[0] in items_list],
+    items_set = set(items_list)
+    items_sorted_by_agent = sorted([x for x in agent.desired_items if x[0] in items_set],
                                    key=lambda x: agent.map_good_to_value[x], reverse=True)
     bundle_items = set([x[0] for x in items_sorted_by_agent[:2]] + [agent.aq_items[1]])
     return agent.value(bundle_items), bundle_items
@@ -273,9 +273,11 @@ def cycle_allocation(agents_dict: Dict[str, Allocation], item_list: List[str], r
     [('Alice', ['d', 'e']), ('Bob', ['a', 'f']), ('Eve', ['b', 'c'])]
     """
     logger.info('\tItems remaining: ' + ','.join(item_list))
+    item_set = set(item_list)  # kept in sync with item_list, for constant-time membership checks
     for k, p in sorted(agents_dict.items(), reverse=reverse):
-        max_item = max([x for x in p.desired_items if x[0] in item_list], key=lambda x: p.map_good_to_value[x])
+        max_item = max([x for x in p.desired_items if x[0] in item_set], key=lambda x: p.map_good_to_value[x])
         item_list.remove(max_item)
+        item_set.discard(max_item)
         p.aq_items.append(max_item)
         logger.info("\tAgent {} took item {} Value: {}".format(p.name(), max_item, p.map_good_to_value[max_item]))
 
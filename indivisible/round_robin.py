@@ -33,21 +33,39 @@ def round_robin(items:Bundle, agents:List[AdditiveAgent], agent_order:List[int])
     True
     >>> George.is_EF(allocation.get_bundle(1), allocation.get_bundles())
     False
+
+    Values are compared exactly, and ties are broken in favor of the first remaining item:
+    >>> round_robin("xy", [AdditiveAgent({"x": 2**60, "y": 2**60+1}), AdditiveAgent({"x": 1, "y": 1})], [0,1]).get_bundles()
+    [['y'], ['x']]
+    >>> from fractions import Fraction
+    >>> round_robin("xy", [AdditiveAgent({"x": Fraction(1,3), "y": Fraction(1,3)+Fraction(1,10**20)})], [0]).get_bundles()
+    [['y', 'x']]
+    >>> round_robin("xyz", [AdditiveAgent({"x": 1, "y": 1, "z": 1}), AdditiveAgent({"x": 1, "y": 1, "z": 1})], [1,0]).get_bundles()
+    [['y'], ['x', 'z']]
     """
     logger.info("\nRound Robin with order %s", agent_order)
     allocation = [[] for _ in agents]
     agent_order = list(agent_order)
-    remaining_items = list(items)
+    items = list(items)
+    is_remaining = [True]*len(items)
+    # values[i][j] is the value of agents[i] for items[j]; computed once, on the agent's first turn.
+    values = [None]*len(agents)
+    num_of_remaining_items = len(items)
     while True:
         for agent_index in agent_order:
-            if len(remaining_items)==0:
+            if num_of_remaining_items==0:
                 return Allocation(agents, allocation)
             agent = agents[agent_index]
-            best_item_for_agent = max(remaining_items, key=agent.value)
-            best_item_value = agent.value(best_item_for_agent)
+            if values[agent_index] is None:
+                values[agent_index] = [agent.value(item) for item in items]
+            agent_values = values[agent_index]
+            best_item_index = max((j for j in range(len(items)) if is_remaining[j]), key=agent_values.__getitem__)
+            best_item_for_agent = items[best_item_index]
+            best_item_value = agent_values[best_item_index]
             allocation[agent_index].append(best_item_for_agent)
             logger.info("%s takes %s (value %d)", agent.name(), best_item_for_agent, best_item_value)
-            remaining_items.remove(best_item_for_agent)
+            is_remaining[best_item_index] = False
+            num_of_remaining_items -= 1
 
 
 